@@ -0,0 +1,66 @@
+"""
+Version counters used to key and invalidate cached API responses.
+
+Cached list responses embed the relevant version numbers in their cache
+key; bumping a version makes every older entry unreachable, so nothing
+has to be deleted explicitly.
+"""
+
+import time
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+ARTICLES_VERSION_KEY = 'api:articles:version'
+PUBLISHERS_VERSION_KEY = 'api:publishers:version'
+
+
+# Backends whose entries live in one worker process; invalidating them
+# from a write only reaches the worker that handled it
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def shared_cache_configured():
+    """
+    Return whether the default cache is shared by every worker process.
+    """
+    return settings.CACHES['default']['BACKEND'] not in PROCESS_LOCAL_BACKENDS
+
+
+def subscriptions_version_key(user_id):
+    return f'api:subscriptions:{user_id}:version'
+
+
+def get_version(key):
+    """
+    Return the current value of a version counter, creating it if needed.
+
+    Counters start from the current time rather than 1 so a counter that
+    was evicted from the cache never reuses an older version number.
+    """
+    return cache.get_or_set(key, time.time_ns, timeout=None)
+
+
+def bump_version(key):
+    """
+    Invalidate every cached response keyed on this version counter.
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def bump_version_on_commit(key):
+    """
+    Bump a version counter once the current transaction commits.
+
+    Bumping before the commit would let a concurrent request cache the
+    pre-commit rows under the new version.
+    """
+    transaction.on_commit(partial(bump_version, key))
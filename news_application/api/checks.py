@@ -0,0 +1,28 @@
+"""
+System checks for the news API.
+"""
+
+from django.core.checks import Warning, register
+
+
+@register()
+def check_drf_lazy_format(app_configs, **kwargs):
+    """
+    Warn when the installed DRF builds field error messages with Django's lazy().
+
+    Older DRF releases wrapped every length/value message in
+    django.utils.functional.lazy, which dominates serializer __init__
+    time. Releases that ship rest_framework.utils.formatting.lazy_format
+    defer the formatting cheaply instead.
+    """
+    from rest_framework.utils import formatting
+
+    if hasattr(formatting, 'lazy_format'):
+        return []
+    return [
+        Warning(
+            'The installed djangorestframework formats field error messages with lazy().',
+            hint='Install the version pinned in requirements.txt.',
+            id='api.W001',
+        )
+    ]
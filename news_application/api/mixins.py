@@ -0,0 +1,203 @@
+"""
+Reusable mixins for the news API viewsets.
+
+Keeps queryset optimisation in step with the serializers so nested
+fields never fall back to one query per row, and provides a plain-dict
+fast path and per-user response caching for list pages.
+"""
+
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework.response import Response
+from .caching import get_version, shared_cache_configured
+
+
+def build_prefetch_plan(serializer, model, prefix=''):
+    """
+    Work out which relations and columns a serializer will read.
+
+    Walks the serializer's fields and maps every nested serializer onto
+    the matching model relation. Forward foreign keys and one-to-one
+    fields are joined with select_related, everything else (many-to-many
+    and reverse relations) is fetched with a Prefetch whose queryset is
+    shaped by the nested serializer. Plain fields are collected into an
+    only() list so unused columns are not loaded.
+
+    Args:
+        serializer: Serializer instance to inspect
+        model: Model class the serializer reads from
+        prefix (str): Lookup prefix used when recursing into nested serializers
+
+    Returns:
+        tuple: (select_related lookups, prefetch_related lookups and
+        Prefetch objects, only() lookups or None when a field cannot be
+        mapped to a column)
+    """
+    select, prefetch, only = [], [], []
+
+    for field in serializer.fields.values():
+        nested = field.child if isinstance(field, serializers.ListSerializer) else field
+        is_nested = isinstance(nested, serializers.BaseSerializer)
+
+        # Only simple attribute sources map onto a model field
+        if field.source == '*' or '.' in field.source:
+            only = None
+            continue
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            # Nested serializers without a matching attribute are skipped
+            # at render time; anything else may read arbitrary columns
+            if not is_nested:
+                only = None
+            continue
+
+        lookup = prefix + field.source
+        if not is_nested:
+            if only is not None and model_field.concrete:
+                only.append(lookup)
+            elif not model_field.concrete:
+                only = None
+            continue
+        if not model_field.is_relation:
+            continue
+
+        if (model_field.many_to_one or model_field.one_to_one) and model_field.concrete:
+            nested_select, nested_prefetch, nested_only = build_prefetch_plan(
+                nested, model_field.related_model, prefix=lookup + '__'
+            )
+            select.append(lookup)
+            select.extend(nested_select)
+            prefetch.extend(nested_prefetch)
+            if only is not None and nested_only is not None:
+                only.extend(nested_only)
+            else:
+                only = None
+        else:
+            prefetch.append(build_prefetch(lookup, model_field, nested))
+
+    return select, prefetch, only
+
+
+def build_prefetch(lookup, model_field, serializer):
+    """
+    Build a Prefetch for a many-valued relation shaped by its serializer.
+
+    The related queryset joins and restricts columns the same way as the
+    top-level plan, so prefetched rows carry only what is rendered.
+
+    Args:
+        lookup (str): prefetch_related lookup for the relation
+        model_field: Many-to-many or reverse relation field on the parent model
+        serializer: Nested serializer used for the related objects
+
+    Returns:
+        Prefetch: Prefetch object with an explicit queryset
+    """
+    related_model = model_field.related_model
+    select, prefetch, only = build_prefetch_plan(serializer, related_model)
+    queryset = related_model._default_manager.all()
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    if only is not None:
+        # Reverse foreign keys are matched back to the parent through the FK
+        if model_field.one_to_many:
+            only.append(model_field.field.name)
+        queryset = queryset.only(*only)
+    return Prefetch(lookup, queryset=queryset)
+
+
+class AutoPrefetchViewSetMixin:
+    """
+    Apply select_related/prefetch_related/only derived from the serializer.
+
+    The plan is computed once per serializer class and cached on the
+    mixin, so requests only pay for a dictionary lookup.
+    """
+    _prefetch_plans = {}
+
+    def prefetch(self, queryset):
+        """
+        Return the queryset with the serializer's relations preloaded
+        and only the columns it renders selected.
+        """
+        serializer_class = self.get_serializer_class()
+        plan = self._prefetch_plans.get(serializer_class)
+        if plan is None:
+            plan = build_prefetch_plan(serializer_class(), queryset.model)
+            self._prefetch_plans[serializer_class] = plan
+
+        select, prefetch, only = plan
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        if only:
+            queryset = queryset.only(*only)
+        return queryset
+
+
+class PlainListMixin:
+    """
+    Serialize list pages with a plain-dict function instead of DRF fields.
+
+    Subclasses set ``serialize_page`` to a function taking an iterable of
+    model instances and returning a list of dicts that matches the
+    viewset's serializer output. Detail views keep the DRF serializer.
+    """
+    serialize_page = None
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        return self.fast_list_response(queryset)
+
+    def fast_list_response(self, queryset):
+        """Paginate and serialize a queryset with ``serialize_page``"""
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.serialize_page(page))
+        return Response(self.serialize_page(queryset))
+
+
+class CachedListMixin:
+    """
+    Cache list response data per user for ``list_cache_timeout`` seconds.
+
+    The cache key holds the user, their role, the full request path
+    (page and query parameters) and the version counters returned by
+    ``get_list_cache_versions``; bumping any of those counters
+    invalidates the entry.
+
+    Caching is skipped unless the default cache is shared by every
+    worker process (e.g. Redis); with a per-process cache a write would
+    only invalidate the worker that handled it.
+    """
+    list_cache_timeout = 60
+    list_cache_version_keys = ()
+
+    def get_list_cache_versions(self):
+        return [get_version(key) for key in self.list_cache_version_keys]
+
+    def cached_response(self, build_response):
+        """Return cached response data, or build, cache and return a fresh response"""
+        if not shared_cache_configured():
+            return build_response()
+        user = self.request.user
+        versions = ':'.join(str(version) for version in self.get_list_cache_versions())
+        key = f'api:{self.basename}:{user.role}:{user.pk}:{versions}:{self.request.get_full_path()}'
+
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+
+        response = build_response()
+        if response.status_code == 200:
+            cache.set(key, response.data, self.list_cache_timeout)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(lambda: super(CachedListMixin, self).list(request, *args, **kwargs))
@@ -0,0 +1,17 @@
+from rest_framework import permissions
+
+
+class IsSubscribedReader(permissions.BasePermission):
+    """
+    Readers may only view articles from publishers or journalists they follow.
+    Other roles are scoped by the viewset's queryset instead.
+    """
+    message = "You are not subscribed to this article's publisher or journalist."
+
+    def has_object_permission(self, request, view, obj):
+        user = request.user
+        if user.role != 'reader':
+            return True
+        if user.subscribed_journalists.filter(pk=obj.author_id).exists():
+            return True
+        return bool(obj.publisher_id) and user.subscribed_publishers.filter(pk=obj.publisher_id).exists()
@@ -1,18 +1,41 @@
+import copy
 from rest_framework import serializers
 from news_app.models import Article, Publisher
 from news_app.models import CustomUser
 
-class UserSerializer(serializers.ModelSerializer):
+class CachedFieldsSerializer:
+    """
+    Build a ModelSerializer's fields once per class.
+
+    ModelSerializer introspects the model on every instantiation, which is
+    repeated for each nested serializer. The result is cached per class and
+    every instance gets shallow copies that are bound afresh. A
+    ``many=True`` field's ListSerializer is bound to its child when it is
+    built, so a shallow copy would share that child (and its context)
+    between instances; those are deep-copied instead, which rebuilds both.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        return {
+            name: copy.deepcopy(field) if isinstance(field, serializers.ListSerializer) else copy.copy(field)
+            for name, field in self._fields_cache[cls].items()
+        }
+
+class UserSerializer(CachedFieldsSerializer, serializers.ModelSerializer):
     class Meta:
         model = CustomUser
         fields = ['id', 'username', 'email', 'role']
 
-class PublisherSerializer(serializers.ModelSerializer):
+class PublisherSerializer(CachedFieldsSerializer, serializers.ModelSerializer):
     class Meta:
         model = Publisher
         fields = ['id', 'name', 'description',]
 
-class ArticleSerializer(serializers.ModelSerializer):
+class ArticleSerializer(CachedFieldsSerializer, serializers.ModelSerializer):
     author = UserSerializer(read_only=True)
     publisher = PublisherSerializer(read_only=True)
     approved_by = UserSerializer(read_only=True)
@@ -24,3 +47,49 @@ class ArticleSerializer(serializers.ModelSerializer):
             'created_at', 'is_approved', 'approved_by'
         ]
         read_only_fields = ['id','author',]
+
+class ArticleListSerializer(ArticleSerializer):
+    """Article summary for list endpoints; the full content is only on detail."""
+    class Meta(ArticleSerializer.Meta):
+        fields = [
+            'id', 'title', 'author', 'publisher',
+            'created_at', 'is_approved'
+        ]
+
+
+# Plain-dict serialization for the list endpoints. Mirrors the output of
+# the serializers above (ArticleListSerializer for articles) without
+# per-field DRF overhead; article querysets must already join author and
+# publisher.
+_created_at_field = serializers.DateTimeField()
+
+def serialize_user(user):
+    return {
+        'id': user.id,
+        'username': user.username,
+        'email': user.email,
+        'role': user.role,
+    }
+
+def serialize_publisher(publisher):
+    return {
+        'id': publisher.id,
+        'name': publisher.name,
+        'description': publisher.description,
+    }
+
+def serialize_users(users):
+    return [serialize_user(user) for user in users]
+
+def serialize_publishers(publishers):
+    return [serialize_publisher(publisher) for publisher in publishers]
+
+def serialize_articles(articles):
+    return [{
+        'id': article.id,
+        'title': article.title,
+        'author': serialize_user(article.author),
+        'publisher': serialize_publisher(article.publisher) if article.publisher_id else None,
+        'created_at': _created_at_field.to_representation(article.created_at),
+        'is_approved': article.is_approved,
+    } for article in articles]
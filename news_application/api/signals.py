@@ -0,0 +1,53 @@
+"""
+Signal receivers that invalidate cached API responses.
+
+Versions are bumped once the write commits, so responses built from the
+old rows can never be cached under the new version.
+"""
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from news_app.models import Article, Publisher
+from users.models import CustomUser
+from .caching import (
+    ARTICLES_VERSION_KEY, PUBLISHERS_VERSION_KEY,
+    bump_version_on_commit, subscriptions_version_key,
+)
+
+
+@receiver(post_save, sender=Article)
+@receiver(post_delete, sender=Article)
+def invalidate_articles(sender, **kwargs):
+    bump_version_on_commit(ARTICLES_VERSION_KEY)
+
+
+@receiver(post_save, sender=Publisher)
+@receiver(post_delete, sender=Publisher)
+def invalidate_publishers(sender, **kwargs):
+    bump_version_on_commit(PUBLISHERS_VERSION_KEY)
+    # Articles embed their publisher
+    bump_version_on_commit(ARTICLES_VERSION_KEY)
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_authors(sender, update_fields=None, **kwargs):
+    # Logging in only touches last_login, which no response includes
+    if update_fields and set(update_fields) <= {'last_login'}:
+        return
+    # Articles embed their author
+    bump_version_on_commit(ARTICLES_VERSION_KEY)
+
+
+@receiver(m2m_changed, sender=CustomUser.subscribed_publishers.through)
+@receiver(m2m_changed, sender=CustomUser.subscribed_journalists.through)
+def invalidate_subscriptions(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        bump_version_on_commit(subscriptions_version_key(instance.pk))
+    elif pk_set:
+        for user_id in pk_set:
+            bump_version_on_commit(subscriptions_version_key(user_id))
+    else:
+        # A reverse clear() does not report which readers were affected
+        bump_version_on_commit(ARTICLES_VERSION_KEY)
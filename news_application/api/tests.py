@@ -1,11 +1,21 @@
-from django.test import TestCase
+import tempfile
+from django.test import TestCase, override_settings
+from django.core.cache import cache
 from django.contrib.auth import get_user_model
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from news_app.models import Article, Publisher
+from .caching import ARTICLES_VERSION_KEY, get_version
+from .checks import check_drf_lazy_format
+from .mixins import build_prefetch_plan
+from .serializers import (
+    ArticleListSerializer, ArticleSerializer, PublisherSerializer, UserSerializer,
+    serialize_articles, serialize_publishers, serialize_users,
+)
 
 class APITests(APITestCase):
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.user_model = get_user_model()
         
@@ -167,3 +177,195 @@ class APITests(APITestCase):
         else:
             # If not paginated, just make sure we get data
             self.assertTrue(len(response.data) > 0)
+
+    def test_article_list_query_count(self):
+        """Test that nested author/publisher data does not cause N+1 queries"""
+        self.client.force_authenticate(user=self.editor)
+        
+        for i in range(5):
+            Article.objects.create(
+                title=f'Extra Article {i}',
+                content='Extra content',
+                author=self.journalist,
+                publisher=self.publisher,
+                is_approved=True
+            )
+        
+        # One COUNT for pagination plus one SELECT for the page
+        with self.assertNumQueries(2):
+            response = self.client.get('/api/articles/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_prefetch_plan_follows_nested_serializers(self):
+        """Test that the prefetch plan joins nested foreign keys"""
+        select, prefetch, only = build_prefetch_plan(ArticleSerializer(), Article)
+        self.assertEqual(select, ['author', 'publisher'])
+        self.assertEqual(prefetch, [])
+        self.assertIn('content', only)
+        self.assertIn('author__username', only)
+        self.assertNotIn('author__password', only)
+
+    def test_prefetch_plan_shapes_many_relations(self):
+        """Test that many-valued nested serializers get a column-limited Prefetch"""
+        class PublisherWithEditorsSerializer(PublisherSerializer):
+            editors = UserSerializer(many=True, read_only=True)
+            
+            class Meta(PublisherSerializer.Meta):
+                fields = ['id', 'name', 'editors']
+        
+        self.publisher.editors.add(self.editor)
+        select, prefetch, only = build_prefetch_plan(PublisherWithEditorsSerializer(), Publisher)
+        self.assertEqual(select, [])
+        self.assertEqual(prefetch[0].prefetch_to, 'editors')
+        
+        publishers = Publisher.objects.prefetch_related(*prefetch).only(*only)
+        with self.assertNumQueries(2):
+            data = PublisherWithEditorsSerializer(publishers, many=True).data
+        self.assertEqual(data[0]['editors'][0]['username'], 'testeditor')
+
+    def test_list_plan_skips_content(self):
+        """Test that the list serializer plan does not load article content"""
+        select, prefetch, only = build_prefetch_plan(ArticleListSerializer(), Article)
+        self.assertNotIn('content', only)
+        self.assertIn('publisher__name', only)
+
+    def test_cached_serializer_fields_are_not_shared(self):
+        """Test that cached serializer fields are copied per instance"""
+        first = ArticleSerializer(self.approved_article)
+        second = ArticleSerializer(self.pending_article)
+        self.assertIsNot(first.fields['author'], second.fields['author'])
+        self.assertIs(first.fields['author'].parent, first)
+        self.assertEqual(first.data['title'], 'Approved Test Article')
+        self.assertEqual(second.data['title'], 'Pending Test Article')
+
+    def test_cached_many_fields_rebuild_their_child(self):
+        """Test that many=True fields get their own child bound to each instance"""
+        class PublisherWithEditorsSerializer(PublisherSerializer):
+            editors = UserSerializer(many=True, read_only=True)
+            
+            class Meta(PublisherSerializer.Meta):
+                fields = ['id', 'name', 'editors']
+        
+        request = object()
+        first = PublisherWithEditorsSerializer(self.publisher, context={'request': request})
+        second = PublisherWithEditorsSerializer(self.publisher)
+        self.assertIsNot(first.fields['editors'].child, second.fields['editors'].child)
+        self.assertIs(first.fields['editors'].child.context['request'], request)
+
+    def test_fast_list_matches_serializer(self):
+        """Test that the plain-dict list output matches ArticleListSerializer"""
+        articles = Article.objects.select_related('author', 'publisher').order_by('id')
+        self.assertEqual(
+            serialize_articles(articles),
+            ArticleListSerializer(articles, many=True).data
+        )
+
+    def test_article_content_only_on_detail(self):
+        """Test that list responses omit content while detail includes it"""
+        self.client.force_authenticate(user=self.editor)
+        
+        response = self.client.get('/api/articles/')
+        results = self.get_results_from_response(response)
+        self.assertNotIn('content', results[0])
+        
+        response = self.client.get(f'/api/articles/{self.approved_article.id}/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['content'], 'This is an approved test article content.')
+
+    def test_fast_publisher_and_user_lists_match_serializers(self):
+        """Test that the plain-dict publisher and user output matches the serializers"""
+        publishers = Publisher.objects.order_by('id')
+        self.assertEqual(
+            serialize_publishers(publishers),
+            PublisherSerializer(publishers, many=True).data
+        )
+        
+        users = self.user_model.objects.order_by('id')
+        self.assertEqual(
+            serialize_users(users),
+            UserSerializer(users, many=True).data
+        )
+
+    def test_installed_drf_uses_lazy_format(self):
+        """Test that the pinned DRF defers error message formatting"""
+        self.assertEqual(check_drf_lazy_format(None), [])
+
+    def test_subscription_ids_loaded_once_per_request(self):
+        """Test that a reader's subscriptions are queried once per list request"""
+        self.client.force_authenticate(user=self.reader)
+        self.reader.subscribed_publishers.add(self.publisher)
+        
+        # Two subscription lookups, one COUNT and one page SELECT
+        with self.assertNumQueries(4):
+            response = self.client.get('/api/articles/my_subscriptions/')
+        self.assertEqual(len(self.get_results_from_response(response)), 1)
+
+    def use_shared_cache(self):
+        """Switch list caching on with a file cache, shared across processes, in a temporary directory"""
+        cache_dir = tempfile.TemporaryDirectory(prefix='news-api-cache-')
+        self.addCleanup(cache_dir.cleanup)
+        shared_cache = override_settings(CACHES={
+            'default': {
+                'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                'LOCATION': cache_dir.name,
+            }
+        })
+        shared_cache.enable()
+        self.addCleanup(shared_cache.disable)
+
+    def test_article_list_served_from_cache(self):
+        """Test that repeated list requests are cached until subscriptions change"""
+        self.use_shared_cache()
+        self.client.force_authenticate(user=self.reader)
+        self.client.get('/api/articles/')
+        
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/articles/')
+        self.assertEqual(len(self.get_results_from_response(response)), 0)
+        
+        # Subscribing bumps the reader's subscription version
+        with self.captureOnCommitCallbacks(execute=True):
+            self.reader.subscribed_publishers.add(self.publisher)
+        response = self.client.get('/api/articles/')
+        self.assertEqual(len(self.get_results_from_response(response)), 1)
+        
+        # Approving another article bumps the article version
+        with self.captureOnCommitCallbacks(execute=True):
+            self.pending_article.is_approved = True
+            self.pending_article.save()
+        response = self.client.get('/api/articles/')
+        self.assertEqual(len(self.get_results_from_response(response)), 2)
+
+    def test_article_list_not_cached_in_process_local_cache(self):
+        """Test that list caching stays off with the per-process LocMemCache"""
+        self.client.force_authenticate(user=self.reader)
+        self.client.get('/api/articles/')
+        
+        # The second request queries the database again
+        with self.assertNumQueries(2):
+            self.client.get('/api/articles/')
+
+    def test_article_version_bumped_on_commit(self):
+        """Test that saving an article only bumps the article version once it commits"""
+        version = get_version(ARTICLES_VERSION_KEY)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.pending_article.save()
+            self.assertEqual(get_version(ARTICLES_VERSION_KEY), version)
+        self.assertGreater(get_version(ARTICLES_VERSION_KEY), version)
+
+    def test_reader_article_detail_requires_subscription(self):
+        """Test that readers can only retrieve articles they are subscribed to"""
+        self.client.force_authenticate(user=self.reader)
+        url = f'/api/articles/{self.approved_article.id}/'
+        
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        
+        self.reader.subscribed_journalists.add(self.journalist)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'Approved Test Article')
+        
+        # Pending articles stay hidden from readers
+        response = self.client.get(f'/api/articles/{self.pending_article.id}/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
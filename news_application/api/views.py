@@ -2,44 +2,77 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.db.models import Q
+from django.utils.functional import cached_property
 from news_app.models import Article, Publisher
 from news_app.models import CustomUser
-from .serializers import ArticleSerializer, PublisherSerializer, UserSerializer
+from .caching import ARTICLES_VERSION_KEY, PUBLISHERS_VERSION_KEY, get_version, subscriptions_version_key
+from .mixins import AutoPrefetchViewSetMixin, CachedListMixin, PlainListMixin
+from .permissions import IsSubscribedReader
+from .serializers import (
+    ArticleListSerializer, ArticleSerializer, PublisherSerializer, UserSerializer,
+    serialize_articles, serialize_publishers, serialize_users,
+)
 
-class ArticleViewSet(viewsets.ReadOnlyModelViewSet):
+class ArticleViewSet(AutoPrefetchViewSetMixin, CachedListMixin, PlainListMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint that allows articles to be viewed.
     Articles are filtered based on user subscriptions.
     """
     serializer_class = ArticleSerializer
-    permission_classes = [permissions.IsAuthenticated]
-    queryset = Article.objects.all()
+    serialize_page = staticmethod(serialize_articles)
+    permission_classes = [permissions.IsAuthenticated, IsSubscribedReader]
+    # Only used for routing/introspection; get_queryset scopes by role
+    queryset = Article.objects.none()
     
     def get_queryset(self):
         user = self.request.user
-        queryset = Article.objects.filter(is_approved=True)
+        queryset = Article.objects.all()
+        
+        # Editors can see all articles, everyone else only approved ones
+        if user.role != 'editor':
+            queryset = queryset.filter(is_approved=True)
         
-        # If user is a reader, show only articles from their subscriptions
+        # If user is a reader, show only articles from their subscriptions.
+        # Single-article lookups are checked by IsSubscribedReader instead,
+        # which avoids loading every subscription for one row
         if user.role == 'reader':
-            # Get user's subscriptions
-            subscribed_publishers = user.subscribed_publishers.all()
-            subscribed_journalists = user.subscribed_journalists.all()
-            
-            # Filter articles by subscriptions
-            queryset = queryset.filter(
-                Q(publisher__in=subscribed_publishers) |
-                Q(author__in=subscribed_journalists)
-            ).distinct()
+            if self.action != 'retrieve':
+                queryset = queryset.filter(self.subscription_filter())
         
         # If user is journalist, show their own articles
         elif user.role == 'journalist':
             queryset = queryset.filter(author=user)
         
-        # Editors can see all articles
-        elif user.role == 'editor':
-            queryset = Article.objects.all()
-        
-        return queryset.order_by('-created_at')
+        # Preload the nested serializer relations to avoid N+1 queries and
+        # select only the rendered columns (list pages skip the content)
+        return self.prefetch(queryset).order_by('-created_at')
+    
+    def get_list_cache_versions(self):
+        return [
+            get_version(ARTICLES_VERSION_KEY),
+            get_version(subscriptions_version_key(self.request.user.pk)),
+        ]
+    
+    def get_serializer_class(self):
+        if self.action in ('list', 'my_subscriptions'):
+            return ArticleListSerializer
+        return ArticleSerializer
+    
+    @cached_property
+    def subscription_ids(self):
+        """IDs of the current user's subscribed publishers and journalists, loaded once per request"""
+        user = self.request.user
+        return (
+            list(user.subscribed_publishers.values_list('id', flat=True)),
+            list(user.subscribed_journalists.values_list('id', flat=True)),
+        )
+    
+    def subscription_filter(self):
+        """Q object matching articles from the current user's subscriptions"""
+        publisher_ids, journalist_ids = self.subscription_ids
+        # Both conditions are on the article's own FK columns, so no join
+        # and no DISTINCT is needed
+        return Q(publisher_id__in=publisher_ids) | Q(author_id__in=journalist_ids)
     
     @action(detail=False, methods=['get'])
     def my_subscriptions(self, request):
@@ -48,30 +81,23 @@ class ArticleViewSet(viewsets.ReadOnlyModelViewSet):
             return Response({"error": "This endpoint is for readers only"}, 
                           status=status.HTTP_403_FORBIDDEN)
         
-        subscribed_publishers = request.user.subscribed_publishers.all()
-        subscribed_journalists = request.user.subscribed_journalists.all()
-        
-        articles = Article.objects.filter(
-            Q(publisher__in=subscribed_publishers) |
-            Q(author__in=subscribed_journalists),
-            is_approved=True
-        ).distinct().order_by('-created_at')
-        
-        # Use pagination
-        page = self.paginate_queryset(articles)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+        def build_response():
+            articles = self.prefetch(Article.objects.filter(
+                self.subscription_filter(),
+                is_approved=True
+            )).order_by('-created_at')
+            return self.fast_list_response(articles)
         
-        serializer = self.get_serializer(articles, many=True)
-        return Response(serializer.data)
+        return self.cached_response(build_response)
 
-class PublisherViewSet(viewsets.ReadOnlyModelViewSet):
+class PublisherViewSet(CachedListMixin, PlainListMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint that allows publishers to be viewed.
     """
     queryset = Publisher.objects.all()
     serializer_class = PublisherSerializer
+    serialize_page = staticmethod(serialize_publishers)
+    list_cache_version_keys = (PUBLISHERS_VERSION_KEY,)
     permission_classes = [permissions.IsAuthenticated]
     
     @action(detail=True, methods=['post'])
@@ -92,17 +118,18 @@ class PublisherViewSet(viewsets.ReadOnlyModelViewSet):
         request.user.subscribed_publishers.remove(publisher)
         return Response({"status": f"Unsubscribed from {publisher.name}"})
 
-class UserViewSet(viewsets.ReadOnlyModelViewSet):
+class UserViewSet(AutoPrefetchViewSetMixin, PlainListMixin, viewsets.ReadOnlyModelViewSet):
     """
     API endpoint that allows users to be viewed.
     """
     queryset = CustomUser.objects.all()
     serializer_class = UserSerializer
+    serialize_page = staticmethod(serialize_users)
     permission_classes = [permissions.IsAuthenticated]
     
     def get_queryset(self):
         # Users can only see journalists (for subscription purposes)
-        return CustomUser.objects.filter(role='journalist')
+        return self.prefetch(CustomUser.objects.filter(role='journalist'))
     
     @action(detail=True, methods=['post'])
     def subscribe(self, request, pk=None):
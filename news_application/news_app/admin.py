@@ -11,12 +11,25 @@ class CustomUserAdmin(UserAdmin):
 class PublisherAdmin(admin.ModelAdmin):
     filter_horizontal = ('editors', 'journalists')
 
+class UpdateChangedFieldsMixin:
+    """
+    Save edited objects with update_fields limited to the changed form fields.
+
+    Approving from the changelist (list_editable is_approved) then issues
+    UPDATE ... SET is_approved = ... instead of rewriting every column.
+    """
+    def save_model(self, request, obj, form, change):
+        if change:
+            obj.save(update_fields=form.changed_data)
+        else:
+            super().save_model(request, obj, form, change)
+
 @admin.register(Article)
-class ArticleAdmin(admin.ModelAdmin):
+class ArticleAdmin(UpdateChangedFieldsMixin, admin.ModelAdmin):
     list_display = ('title', 'author', 'publisher', 'is_approved')
     list_editable = ('is_approved',)
 
 @admin.register(Newsletter)
-class NewsletterAdmin(admin.ModelAdmin):
+class NewsletterAdmin(UpdateChangedFieldsMixin, admin.ModelAdmin):
     list_display = ('title', 'author', 'publisher', 'is_approved')
     list_editable = ('is_approved',)
\ No newline at end of file
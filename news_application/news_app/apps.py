@@ -5,5 +5,4 @@ class NewsAppConfig(AppConfig):
     name = 'news_app'
     
     def ready(self):
-        #import news_app.signals
-        pass
\ No newline at end of file
+        from . import signals  # noqa: F401
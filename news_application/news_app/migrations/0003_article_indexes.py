@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_app', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['-created_at'], name='news_app_ar_created_1406ee_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['is_approved', '-created_at'], name='news_app_ar_is_appr_de142f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['author', 'is_approved', '-created_at'], name='news_app_ar_author__29ea4a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['publisher', 'is_approved', '-created_at'], name='news_app_ar_publish_7194b8_idx'),
+        ),
+    ]
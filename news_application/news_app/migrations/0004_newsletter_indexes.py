@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_app', '0003_article_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='newsletter',
+            index=models.Index(fields=['is_approved', '-created_at'], name='news_app_ne_is_appr_1f82e7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsletter',
+            index=models.Index(fields=['author', 'is_approved', '-created_at'], name='news_app_ne_author__c382fb_idx'),
+        ),
+    ]
@@ -52,6 +52,16 @@ class Article(models.Model):
     is_approved = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # Every listing filters on approval and orders newest first; the
+        # author/publisher variants serve journalist and subscription feeds
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['is_approved', '-created_at']),
+            models.Index(fields=['author', 'is_approved', '-created_at']),
+            models.Index(fields=['publisher', 'is_approved', '-created_at']),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -77,5 +87,13 @@ class Newsletter(models.Model):
     is_approved = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # Same access paths as Article: approved listings and the
+        # approval queue, newest first, optionally per author
+        indexes = [
+            models.Index(fields=['is_approved', '-created_at']),
+            models.Index(fields=['author', 'is_approved', '-created_at']),
+        ]
+
     def __str__(self):
         return self.title
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""
+Helpers for building and sending subscriber notification emails.
+
+Notification templates only personalise the greeting, so they are
+rendered once per mailing rather than once per subscriber, and messages
+are sent in batches over a single SMTP connection.
+"""
+
+from itertools import islice
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.template.loader import render_to_string
+from django.utils.html import escape
+
+SUBSCRIBER_NAME_PLACEHOLDER = '__subscriber_username__'
+NOTIFICATION_BATCH_SIZE = 500
+
+def render_for_subscribers(template_name, context, html=True):
+    """
+    Render a subscriber email template once for a whole mailing.
+
+    The template is rendered with a placeholder in place of
+    ``subscriber.username``; each subscriber's copy is produced by
+    substituting their username, escaped for HTML templates and as-is
+    for plain-text ones. Templates must not use any other subscriber
+    attribute.
+
+    Args:
+        template_name (str): Email template to render
+        context (dict): Context shared by every recipient
+        html (bool): Whether the template renders HTML
+
+    Returns:
+        callable: Function taking a subscriber and returning their copy
+    """
+    rendered = render_to_string(template_name, {
+        **context,
+        'subscriber': {'username': SUBSCRIBER_NAME_PLACEHOLDER},
+    })
+    quote = escape if html else str
+
+    def render_subscriber(subscriber):
+        return rendered.replace(SUBSCRIBER_NAME_PLACEHOLDER, quote(subscriber.username))
+
+    return render_subscriber
+
+
+def unique_recipients(subscribers):
+    """
+    Yield subscribers, skipping any whose email address was already seen.
+
+    Several accounts can share one address; without this each of them
+    would trigger its own copy of the mailing. Addresses are compared
+    case-insensitively and the first subscriber for an address wins.
+    Subscribers are consumed lazily, so streamed querysets stay streamed.
+
+    Args:
+        subscribers (iterable): Recipients of the mailing
+
+    Yields:
+        Subscribers with distinct email addresses
+    """
+    seen = set()
+    for subscriber in subscribers:
+        email = subscriber.email.lower()
+        if email not in seen:
+            seen.add(email)
+            yield subscriber
+
+
+def build_notification_email(subject, text, html, recipient):
+    """
+    Build a notification email with plain-text and HTML bodies.
+
+    Args:
+        subject (str): Email subject line
+        text (str): Rendered plain-text template, used as the body
+        html (str): Rendered HTML template, attached as the text/html alternative
+        recipient (str): Recipient email address
+
+    Returns:
+        EmailMultiAlternatives: Message ready to send
+    """
+    email = EmailMultiAlternatives(subject, text, settings.DEFAULT_FROM_EMAIL, [recipient])
+    email.attach_alternative(html, 'text/html')
+    return email
+
+def send_in_batches(subscribers, build_email, batch_size=NOTIFICATION_BATCH_SIZE):
+    """
+    Send one email per subscriber in batches over a single connection.
+
+    Messages are built and sent ``batch_size`` at a time, which caps the
+    number of message objects held in memory while the SMTP connection
+    (and its TLS/AUTH handshake) is reused across all batches. Subscribers
+    are consumed lazily, so a streaming ``QuerySet.iterator()`` starts
+    sending before every row has been fetched.
+
+    Args:
+        subscribers (iterable): Recipients of the mailing
+        build_email (callable): Function taking a subscriber and returning an EmailMessage
+        batch_size (int): Number of messages sent per batch
+
+    Returns:
+        int: Number of messages sent
+    """
+    sent = 0
+    connection = get_connection(fail_silently=True)
+    connection.open()
+    try:
+        subscribers = iter(subscribers)
+        while batch := [build_email(subscriber) for subscriber in islice(subscribers, batch_size)]:
+            sent += connection.send_messages(batch) or 0
+    finally:
+        connection.close()
+    return sent
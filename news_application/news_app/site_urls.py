@@ -0,0 +1,38 @@
+"""
+Site-level routes for articles, newsletters and subscriptions.
+
+Included at the project root after the ``news/`` routes. The articles,
+newsletters and subscribe groups are namespaced (e.g.
+``'articles:approve'``). my_articles is also defined in news_app.urls;
+as this module is included later, reverse('my_articles') returns the
+path defined here.
+"""
+
+from django.urls import include, path
+from . import views
+
+urlpatterns = [
+    # The homepage is also served at the site root; it is left unnamed so
+    # reverse('home') keeps returning the news/ route
+    path('', views.home),
+    path('articles/', include(([
+        path('create/', views.create_article, name='create'),
+        path('approve/', views.approve_articles, name='approve_list'),
+        path('approve/<int:article_id>/', views.approve_article, name='approve'),
+    ], 'articles'))),
+    path('newsletters/', include(([
+        path('', views.all_newsletters, name='list'),
+        path('create/', views.create_newsletter, name='create'),
+        path('approve/', views.approve_newsletters, name='approve_list'),
+        path('approve/<int:newsletter_id>/', views.approve_newsletter, name='approve'),
+        path('edit/<int:newsletter_id>/', views.edit_newsletter, name='edit'),
+        path('delete/<int:newsletter_id>/', views.delete_newsletter, name='delete'),
+    ], 'newsletters'))),
+    path('subscribe/', include(([
+        path('', views.subscribe_many, name='many'),
+        path('journalist/<int:journalist_id>/', views.subscribe_journalist, name='journalist'),
+        path('publisher/<int:publisher_id>/', views.subscribe_publisher, name='publisher'),
+    ], 'subscribe'))),
+    path('my-articles/', views.my_articles, name='my_articles'),
+    path('my-newsletters/', views.my_newsletters, name='my_newsletters'),
+]
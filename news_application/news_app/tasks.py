@@ -0,0 +1,160 @@
+"""
+Background tasks for subscriber notifications.
+
+Notification work (emails and the Twitter post) is dispatched once the
+surrounding database transaction commits and runs on a small worker
+thread pool, so the request that approved the content is not held up by
+network I/O. Set NOTIFICATION_TASKS_EAGER = True to run tasks inline,
+e.g. in tests.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import Exists, OuterRef
+from .models import Article, Newsletter
+from .notifications import (
+    NOTIFICATION_BATCH_SIZE, build_notification_email, render_for_subscribers, send_in_batches,
+    unique_recipients,
+)
+from .twitter import post_to_twitter
+from users.models import CustomUser
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='notifications')
+
+def enqueue(task, *args):
+    """
+    Run a task in the background after the current transaction commits.
+
+    Tasks receive primary keys rather than model instances and re-fetch
+    what they need, so they never see uncommitted or stale data.
+
+    Args:
+        task (callable): Task function to run
+        *args: Positional arguments passed to the task
+    """
+    if getattr(settings, 'NOTIFICATION_TASKS_EAGER', False):
+        transaction.on_commit(lambda: task(*args))
+    else:
+        transaction.on_commit(lambda: _executor.submit(_run_task, task, *args))
+
+def _run_task(task, *args):
+    try:
+        task(*args)
+    except Exception:
+        logger.exception("Task %s failed", task.__name__)
+    finally:
+        # Worker threads hold their own connections; release them
+        connections.close_all()
+
+def _subscribed_to(m2m_name, target_id):
+    """
+    EXISTS subquery matching users whose ``m2m_name`` subscriptions include target_id
+    """
+    field = CustomUser._meta.get_field(m2m_name)
+    return Exists(field.remote_field.through.objects.filter(**{
+        field.m2m_field_name(): OuterRef('pk'),
+        field.m2m_reverse_field_name(): target_id,
+    }))
+
+def _send_notifications(item, subscribers, subject, template_name, context):
+    """
+    Email subscribers about approved content and announce it on Twitter.
+
+    The text and HTML templates are each rendered once for the whole
+    mailing, subscribers are streamed in chunks with duplicate addresses
+    skipped, and everything is sent over a single SMTP connection. A
+    failed send is logged and does not stop the Twitter post.
+
+    Args:
+        item: Approved Article or Newsletter
+        subscribers (QuerySet): Recipients, selecting at least email and username
+        subject (str): Email subject line
+        template_name (str): Email template path without its .txt/.html extension
+        context (dict): Template context shared by every recipient
+    """
+    label = item._meta.model_name
+    render_text = render_for_subscribers(f'{template_name}.txt', context, html=False)
+    render_message = render_for_subscribers(f'{template_name}.html', context)
+    
+    def build_email(subscriber):
+        return build_notification_email(
+            subject, render_text(subscriber), render_message(subscriber), subscriber.email
+        )
+    
+    try:
+        # The sent count comes back from the send, so no COUNT(*) is needed
+        email_count = send_in_batches(
+            unique_recipients(subscribers.iterator(chunk_size=NOTIFICATION_BATCH_SIZE)), build_email
+        )
+    except Exception:
+        logger.exception("Email sending failed for %s %s", label, item.pk)
+    else:
+        logger.info("Sent %d emails for %s %s", email_count, label, item.pk)
+    
+    try:
+        twitter_result = post_to_twitter(item)
+        logger.debug("Twitter post: %s", twitter_result)
+    except Exception:
+        logger.exception("Twitter post failed for %s %s", label, item.pk)
+
+def notify_article_approved(article_id):
+    """
+    Email an approved article's subscribers and announce it on Twitter.
+
+    Subscribers are readers following the article's journalist or its
+    publisher.
+
+    Args:
+        article_id (int): Primary key of the approved article
+    """
+    article = Article.objects.select_related('author', 'publisher').get(pk=article_id)
+    logger.info("Notifying subscribers of article: %s", article.title)
+    
+    # Get subscribers to this journalist or to the publisher if exists,
+    # in a single query. EXISTS subqueries never duplicate a user, so
+    # unlike joining the subscription tables no DISTINCT is needed
+    subscription_filter = _subscribed_to('subscribed_journalists', article.author_id)
+    if article.publisher_id:
+        subscription_filter |= _subscribed_to('subscribed_publishers', article.publisher_id)
+    subscribers = CustomUser.objects.filter(
+        subscription_filter,
+        role='reader'
+    ).exclude(email='').only('id', 'email', 'username')
+    
+    _send_notifications(
+        article, subscribers, f'New Article Published: {article.title}', 'news_app/email/new_article',
+        {'article': article, 'site_url': 'http://localhost:8000'}
+    )
+
+def notify_readers_of_article(article_id):
+    """
+    Email every reader about an approved article and announce it on Twitter.
+
+    Args:
+        article_id (int): Primary key of the approved article
+    """
+    article = Article.objects.select_related('author', 'publisher').get(pk=article_id)
+    # Only the columns the email templates read
+    subscribers = CustomUser.objects.filter(role='reader').exclude(email='').only('email', 'username')
+    _send_notifications(
+        article, subscribers, f'New Article Published: {article.title}', 'news_app/email/new_article',
+        {'article': article, 'site_url': 'http://localhost:8000'}
+    )
+
+def notify_readers_of_newsletter(newsletter_id):
+    """
+    Email every reader about an approved newsletter and announce it on Twitter.
+
+    Args:
+        newsletter_id (int): Primary key of the approved newsletter
+    """
+    newsletter = Newsletter.objects.select_related('author', 'publisher').get(pk=newsletter_id)
+    subscribers = CustomUser.objects.filter(role='reader').exclude(email='').only('email', 'username')
+    _send_notifications(
+        newsletter, subscribers, f'New Newsletter: {newsletter.title}', 'news_app/email/new_newsletter',
+        {'newsletter': newsletter, 'site_url': 'http://localhost:8000'}
+    )
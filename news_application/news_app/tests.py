@@ -1,41 +1,56 @@
-from django.test import TestCase, Client
+from unittest import mock
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
+from django.contrib import admin
+from django.core import mail
+from django.db import connection
+from django.template.loader import render_to_string
 from django.urls import reverse
-from .models import Article, Publisher
+from .admin import ArticleAdmin
+from .models import Article, Newsletter, Publisher
+from .notifications import render_for_subscribers, send_in_batches
+from .shortcuts import fast_reverse
+from .signals import handle_article_approval
+from .tasks import notify_article_approved, notify_readers_of_article, notify_readers_of_newsletter
+from . import twitter
+from api.caching import ARTICLES_VERSION_KEY, get_version
 
 class NewsAppTests(TestCase):
-    def setUp(self):
-        self.client = Client()
-        self.user_model = get_user_model()
+    @classmethod
+    def setUpTestData(cls):
+        # Created once per class; each test runs in a rolled-back transaction
+        cls.user_model = get_user_model()
         
-        self.journalist = self.user_model.objects.create_user(
+        cls.journalist = cls.user_model.objects.create_user(
             username='testjournalist',
             password='testpass123',
             role='journalist'
         )
         
-        self.editor = self.user_model.objects.create_user(
+        cls.editor = cls.user_model.objects.create_user(
             username='testeditor',
             password='testpass123',
             role='editor'
         )
         
-        self.reader = self.user_model.objects.create_user(
+        cls.reader = cls.user_model.objects.create_user(
             username='testreader',
+            email='testreader@example.com',
             password='testpass123',
             role='reader'
         )
         
-        self.publisher = Publisher.objects.create(
+        cls.publisher = Publisher.objects.create(
             name='Test Publisher',
             description='Test Description'
         )
         
-        self.article = Article.objects.create(
+        cls.article = Article.objects.create(
             title='Test Article',
             content='Test content',
-            author=self.journalist,
-            publisher=self.publisher,
+            author=cls.journalist,
+            publisher=cls.publisher,
             is_approved=False
         )
 
@@ -56,27 +71,50 @@ class NewsAppTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Welcome to News Application')
 
+    def test_home_page_queries_do_not_grow_with_articles(self):
+        """Test that article authors and publishers are joined, not fetched per row"""
+        Article.objects.filter(pk=self.article.pk).update(is_approved=True)
+        with self.assertNumQueries(2):
+            self.client.get(reverse('home'))
+        
+        for i in range(3):
+            Article.objects.create(
+                title=f'Article {i}', content='Content',
+                author=self.journalist, publisher=self.publisher, is_approved=True
+            )
+        with self.assertNumQueries(2):
+            self.client.get(reverse('home'))
+
     def test_login_required_for_article_creation(self):
         """Test that login is required to create articles"""
-        response = self.client.get(reverse('create_article'))
+        response = self.client.get(reverse('articles:create'))
         self.assertEqual(response.status_code, 302)  # Redirect to login
 
     def test_journalist_can_create_article(self):
         """Test that journalists can access article creation"""
         self.client.login(username='testjournalist', password='testpass123')
-        response = self.client.get(reverse('create_article'))
+        response = self.client.get(reverse('articles:create'))
         self.assertEqual(response.status_code, 200)
 
     def test_editor_can_approve_articles(self):
         """Test that editors can access approval page"""
         self.client.login(username='testeditor', password='testpass123')
-        response = self.client.get(reverse('approve_articles'))
+        response = self.client.get(reverse('articles:approve_list'))
         self.assertEqual(response.status_code, 200)
 
+    def test_approval_queue_is_capped(self):
+        """Test that the approval page lists the oldest APPROVAL_QUEUE_SIZE articles and counts the rest"""
+        Article.objects.create(title='Second Article', content='Content', author=self.journalist)
+        self.client.login(username='testeditor', password='testpass123')
+        with mock.patch('news_app.views.APPROVAL_QUEUE_SIZE', 1):
+            response = self.client.get(reverse('articles:approve_list'))
+        self.assertEqual([article.title for article in response.context['articles']], ['Test Article'])
+        self.assertContains(response, '1 more article pending')
+
     def test_reader_cannot_approve_articles(self):
         """Test that readers cannot access approval page"""
         self.client.login(username='testreader', password='testpass123')
-        response = self.client.get(reverse('approve_articles'))
+        response = self.client.get(reverse('articles:approve_list'))
         self.assertEqual(response.status_code, 302)  # Redirect or permission denied
 
     def test_article_approval_process(self):
@@ -84,7 +122,7 @@ class NewsAppTests(TestCase):
         self.client.login(username='testeditor', password='testpass123')
         
         # Approve the article
-        response = self.client.get(reverse('approve_article', args=[self.article.id]))
+        response = self.client.get(reverse('articles:approve', args=[self.article.id]))
         self.assertEqual(response.status_code, 302)  # Redirect after approval
         
         # Refresh article from database
@@ -92,6 +130,60 @@ class NewsAppTests(TestCase):
         self.assertTrue(self.article.is_approved)
         #self.assertEqual(self.article.is_approved_by, self.editor)
 
+    @override_settings(NOTIFICATION_TASKS_EAGER=True)
+    def test_article_approval_emails_readers(self):
+        """Test that approving an article emails every reader once it commits"""
+        self.client.login(username='testeditor', password='testpass123')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(reverse('articles:approve', args=[self.article.id]))
+            self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, 'New Article Published: Test Article')
+
+    @override_settings(NOTIFICATION_TASKS_EAGER=True)
+    def test_article_approved_twice_notifies_once(self):
+        """Test that a repeated approval neither re-sends emails nor keeps stale API caches"""
+        self.client.login(username='testeditor', password='testpass123')
+        version = get_version(ARTICLES_VERSION_KEY)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(reverse('articles:approve', args=[self.article.id]))
+        self.assertNotEqual(get_version(ARTICLES_VERSION_KEY), version)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(reverse('articles:approve', args=[self.article.id]))
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_admin_saves_only_changed_fields(self):
+        """Test that admin edits update only the fields changed in the form"""
+        model_admin = ArticleAdmin(Article, admin.site)
+        self.article.is_approved = True
+        with CaptureQueriesContext(connection) as queries:
+            model_admin.save_model(None, self.article, mock.Mock(changed_data=['is_approved']), True)
+        
+        updates = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"is_approved"', updates[0])
+        self.assertNotIn('"content"', updates[0])
+
+    def test_delete_article(self):
+        """Test that the author sees the confirmation page and can delete the article"""
+        self.client.login(username='testjournalist', password='testpass123')
+        url = reverse('delete_article', args=[self.article.id])
+        response = self.client.get(url)
+        self.assertContains(response, 'Test Article')
+        self.assertContains(response, 'testjournalist')
+        
+        response = self.client.post(url)
+        self.assertRedirects(response, reverse('dashboard'))
+        self.assertFalse(Article.objects.filter(id=self.article.id).exists())
+
+    def test_reader_cannot_delete_article(self):
+        """Test that other non-editor users cannot delete an article"""
+        self.client.login(username='testreader', password='testpass123')
+        response = self.client.post(reverse('delete_article', args=[self.article.id]))
+        self.assertEqual(response.status_code, 403)
+        self.assertTrue(Article.objects.filter(id=self.article.id).exists())
+
     def test_my_articles_page(self):
         """Test that journalists can view their articles"""
         self.client.login(username='testjournalist', password='testpass123')
@@ -99,6 +191,198 @@ class NewsAppTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Test Article')
 
+    def test_subscribe_many(self):
+        """Test that a reader can subscribe to several journalists and publishers at once"""
+        other_publisher = Publisher.objects.create(name='Other Publisher')
+        self.client.login(username='testreader', password='testpass123')
+        response = self.client.post(reverse('subscribe:many'), {
+            'journalist_ids': [self.journalist.id, self.editor.id],
+            'publisher_ids': [self.publisher.id, other_publisher.id],
+        })
+        self.assertRedirects(response, reverse('home'))
+        # Non-journalists are ignored
+        self.assertQuerySetEqual(self.reader.subscribed_journalists.all(), [self.journalist])
+        self.assertEqual(self.reader.subscribed_publishers.count(), 2)
+
+    def test_subscribe_many_rejects_bad_requests(self):
+        """Test that subscribe_many is POST-only, reader-only and ignores non-numeric IDs"""
+        self.client.login(username='testreader', password='testpass123')
+        self.assertEqual(self.client.get(reverse('subscribe:many')).status_code, 405)
+        
+        response = self.client.post(reverse('subscribe:many'), {
+            'journalist_ids': ['abc', '²', '١', str(self.journalist.id)],
+            'publisher_ids': ['1; DROP', '²'],
+        })
+        self.assertRedirects(response, reverse('home'))
+        self.assertQuerySetEqual(self.reader.subscribed_journalists.all(), [self.journalist])
+        self.assertEqual(self.reader.subscribed_publishers.count(), 0)
+        
+        self.client.login(username='testjournalist', password='testpass123')
+        response = self.client.post(reverse('subscribe:many'), {'publisher_ids': [self.publisher.id]}, follow=True)
+        self.assertContains(response, 'Only readers can subscribe.')
+        self.assertEqual(self.journalist.subscribed_publishers.count(), 0)
+
+    def test_home_links_subscribe_many_for_readers(self):
+        """Test that readers get the subscribe-to-all form on the homepage"""
+        self.article.is_approved = True
+        self.article.save()
+        self.client.login(username='testreader', password='testpass123')
+        response = self.client.get(reverse('home'))
+        self.assertContains(response, f'action="{reverse("subscribe:many")}"')
+        self.assertContains(response, f'name="journalist_ids" value="{self.journalist.id}"')
+
+    @override_settings(NOTIFICATION_TASKS_EAGER=True)
+    def test_approval_signal_emails_subscribers(self):
+        """Test that the approval signal emails journalist and publisher subscribers once"""
+        self.reader.subscribed_journalists.add(self.journalist)
+        self.reader.subscribed_publishers.add(self.publisher)
+        
+        self.article.is_approved = True
+        with self.captureOnCommitCallbacks(execute=True):
+            handle_article_approval(sender=Article, instance=self.article, created=False)
+            # Nothing is sent until the approval commits
+            self.assertEqual(len(mail.outbox), 0)
+        
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['testreader@example.com'])
+        self.assertEqual(mail.outbox[0].subject, 'New Article Published: Test Article')
+
+    def test_saving_approval_notifies_subscribers_once(self):
+        """Test that the connected signal notifies on approval but not on later edits"""
+        self.reader.subscribed_journalists.add(self.journalist)
+        
+        self.article.is_approved = True
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.save()
+        self.assertEqual(len(mail.outbox), 1)
+        
+        self.article.title = 'Edited Title'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.save()
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_notify_article_approved_queries(self):
+        """Test that the notification task fetches the article and subscribers in two queries"""
+        self.reader.subscribed_journalists.add(self.journalist)
+        with self.assertNumQueries(2):
+            notify_article_approved(self.article.id)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_notify_readers_of_article_queries(self):
+        """Test that the reader fan-out fetches the article and readers in two queries"""
+        with self.assertNumQueries(2):
+            notify_readers_of_article(self.article.id)
+        self.assertEqual(len(mail.outbox), 1)
+        # Plain-text body from the text template, alongside the HTML alternative
+        body = mail.outbox[0].body
+        self.assertTrue(body.startswith('Hello testreader,'))
+        self.assertIn('Test Article', body)
+        self.assertNotIn('<', body)
+        self.assertNotIn('{', body)
+        self.assertEqual(mail.outbox[0].alternatives[0].mimetype, 'text/html')
+
+    def test_notification_text_body_is_not_escaped(self):
+        """Test that usernames and titles appear unescaped in the plain-text body"""
+        self.reader.username = "o'reader"
+        self.reader.save()
+        self.article.title = "Reader's <Digest>"
+        self.article.save()
+        
+        notify_readers_of_article(self.article.id)
+        body = mail.outbox[0].body
+        self.assertTrue(body.startswith("Hello o'reader,"))
+        self.assertIn("Reader's <Digest>", body)
+        self.assertNotIn('&#x27;', body)
+        self.assertIn('o&#x27;reader', mail.outbox[0].alternatives[0].content)
+
+    def test_notify_readers_of_newsletter_queries(self):
+        """Test that the newsletter fan-out counts sent emails without a COUNT query"""
+        newsletter = Newsletter.objects.create(
+            title='Test Newsletter', content='Content', author=self.journalist, is_approved=True
+        )
+        with self.assertNumQueries(2) as queries:
+            notify_readers_of_newsletter(newsletter.id)
+        self.assertFalse(any('COUNT(' in query['sql'] for query in queries.captured_queries))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertTrue(mail.outbox[0].body.startswith('Hello testreader,'))
+
+    def test_notification_send_failure_is_logged_once(self):
+        """Test that a failed send is logged without a sent count and still tweets"""
+        with mock.patch('news_app.tasks.send_in_batches', side_effect=OSError), \
+                mock.patch('news_app.tasks.post_to_twitter') as post, \
+                self.assertLogs('news_app.tasks', 'INFO') as logs:
+            notify_article_approved(self.article.id)
+        
+        post.assert_called_once()
+        self.assertTrue(any('Email sending failed for article' in line for line in logs.output))
+        self.assertFalse(any('Sent ' in line for line in logs.output))
+
+    @override_settings(TWITTER_BEARER_TOKEN='token')
+    def test_post_to_twitter_uses_pooled_session(self):
+        """Test that real posts go through the shared session"""
+        with mock.patch.object(twitter._session, 'post') as post:
+            post.return_value.json.return_value = {'data': {'id': '1'}}
+            result = twitter.post_to_twitter(self.article)
+        
+        self.assertTrue(result['success'])
+        self.assertEqual(post.call_args.args, (twitter.TWEETS_URL,))
+        self.assertEqual(post.call_args.kwargs['headers'], {'Authorization': 'Bearer token'})
+
+    def test_render_for_subscribers_matches_full_render(self):
+        """Test that the render-once email matches a per-subscriber render"""
+        self.reader.username = 'reader<&>'
+        context = {'article': self.article, 'site_url': 'http://localhost:8000'}
+        
+        render_message = render_for_subscribers('news_app/email/new_article.html', context)
+        expected = render_to_string('news_app/email/new_article.html', {
+            **context, 'subscriber': self.reader
+        })
+        self.assertEqual(render_message(self.reader), expected)
+
+    def test_send_in_batches_sends_every_message(self):
+        """Test that batched sending covers every subscriber across batches"""
+        recipients = [f'reader{i}@example.com' for i in range(5)]
+        sent = send_in_batches(
+            recipients,
+            lambda email: mail.EmailMessage('Subject', 'Body', 'from@example.com', [email]),
+            batch_size=2
+        )
+        self.assertEqual(sent, 5)
+        self.assertEqual([message.to[0] for message in mail.outbox], recipients)
+
+    def test_notifications_skip_duplicate_and_blank_emails(self):
+        """Test that readers sharing an address get one email and blank addresses none"""
+        self.user_model.objects.create_user(
+            username='duplicate', email='TestReader@example.com', password='testpass123', role='reader'
+        )
+        self.user_model.objects.create_user(username='noemail', password='testpass123', role='reader')
+        
+        notify_readers_of_article(self.article.id)
+        self.assertEqual([message.to for message in mail.outbox], [['testreader@example.com']])
+
+    def test_send_in_batches_streams_subscribers(self):
+        """Test that subscribers are consumed one batch at a time"""
+        consumed = []
+        
+        def recipients():
+            for i in range(4):
+                consumed.append(i)
+                yield f'reader{i}@example.com'
+        
+        def build_email(email):
+            # The first batch is built before the second is read
+            self.assertLessEqual(len(consumed), 2 if len(mail.outbox) < 2 else 4)
+            return mail.EmailMessage('Subject', 'Body', 'from@example.com', [email])
+        
+        self.assertEqual(send_in_batches(recipients(), build_email, batch_size=2), 4)
+
+    def test_fast_reverse_caches_paths(self):
+        """Test that fast_reverse matches reverse and only reverses a name once"""
+        self.assertEqual(fast_reverse('articles:approve_list'), reverse('articles:approve_list'))
+        with mock.patch('news_app.shortcuts.reverse') as reverse_mock:
+            self.assertEqual(fast_reverse('articles:approve_list'), reverse('articles:approve_list'))
+        reverse_mock.assert_not_called()
+
 class ModelTests(TestCase):
     def test_article_str_representation(self):
         """Test Article string representation"""
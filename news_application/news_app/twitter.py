@@ -1,21 +1,31 @@
 import requests
 import json
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+TWEETS_URL = 'https://api.twitter.com/2/tweets'
+
+# One pooled session per process so the TCP/TLS handshake with the
+# Twitter API is reused across posts instead of repeated for each one
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
 
 def post_to_twitter(article):
     """
     Post article to X (Twitter) using their API
-    Note: This is a simulation. For real implementation, you need Twitter API keys.
+    Note: This is a simulation unless settings.TWITTER_BEARER_TOKEN is set.
     """
     try:
         # Simulate Twitter API call
         tweet_text = f"New Article: {article.title}\n\nBy: {article.author.username}\n\nRead more: http://localhost:8000"
         
-        # In a real implementation, you would use:
-        # bearer_token = settings.TWITTER_BEARER_TOKEN
-        # headers = {'Authorization': f'Bearer {bearer_token}'}
-        # data = {'text': tweet_text}
-        # response = requests.post('https://api.twitter.com/2/tweets', headers=headers, json=data)
+        # Post for real when API credentials are configured
+        bearer_token = getattr(settings, 'TWITTER_BEARER_TOKEN', None)
+        if bearer_token:
+            headers = {'Authorization': f'Bearer {bearer_token}'}
+            response = _session.post(TWEETS_URL, headers=headers, json={'text': tweet_text}, timeout=10)
+            response.raise_for_status()
+            return {"success": True, "data": response.json()}
         
         print("=" * 50)
         print(" X (Twitter) POST SIMULATION")
@@ -8,16 +8,44 @@ This module contains all view functions for:
 - Email notifications and Twitter integration
 """
 
-from django.shortcuts import render, get_object_or_404, redirect
+import logging
+from django.shortcuts import render, get_object_or_404
 from django.contrib.auth.decorators import login_required, user_passes_test
+from django.views.decorators.http import require_POST
 from django.contrib import messages
-from django.core.mail import send_mail
-from django.conf import settings
-from django.template.loader import render_to_string
-from django.http import HttpResponseForbidden
+from django.db import transaction
+from django.http import HttpResponseForbidden, HttpResponseRedirect
 from .models import CustomUser, Article, Publisher, Newsletter
 from .forms import ArticleForm, NewsletterForm
-from .twitter import post_to_twitter
+from .shortcuts import fast_reverse
+from .tasks import enqueue, notify_readers_of_article, notify_readers_of_newsletter
+from api.caching import ARTICLES_VERSION_KEY, bump_version_on_commit
+
+logger = logging.getLogger(__name__)
+
+APPROVAL_QUEUE_SIZE = 50
+
+SUBSCRIBE_READERS_ONLY = 'Only readers can subscribe.'
+
+def _approval_queue(pending):
+    """
+    Return the oldest pending items for an approval page.
+    
+    Items are listed oldest first so nothing waits indefinitely behind
+    newer submissions, capped at APPROVAL_QUEUE_SIZE rather than loading
+    the whole backlog.
+    
+    Args:
+        pending (QuerySet): Unapproved articles or newsletters
+        
+    Returns:
+        tuple: (list of at most APPROVAL_QUEUE_SIZE items, number of
+        pending items not shown)
+    """
+    items = list(pending.select_related('author', 'publisher').order_by('created_at')[:APPROVAL_QUEUE_SIZE])
+    # Only count the backlog when the page is full
+    more_pending = pending.count() - len(items) if len(items) == APPROVAL_QUEUE_SIZE else 0
+    return items, more_pending
 
 def home(request):
     """
@@ -32,8 +60,8 @@ def home(request):
     Returns:
         HttpResponse: Rendered homepage template with context
     """
-    articles = Article.objects.filter(is_approved=True).order_by('-created_at')[:10]
-    newsletters = Newsletter.objects.filter(is_approved=True).order_by('-created_at')[:5]
+    articles = Article.objects.filter(is_approved=True).select_related('author', 'publisher').order_by('-created_at')[:10]
+    newsletters = Newsletter.objects.filter(is_approved=True).select_related('author', 'publisher').order_by('-created_at')[:5]
     return render(request, 'home.html', {
         'articles': articles, 
         'newsletters': newsletters
@@ -52,7 +80,7 @@ def all_newsletters(request):
     Returns:
         HttpResponse: Newsletter catalog page with all newsletters
     """
-    newsletters = Newsletter.objects.filter(is_approved=True).order_by('-created_at')
+    newsletters = Newsletter.objects.filter(is_approved=True).select_related('author', 'publisher').order_by('-created_at')
     return render(request, 'news_app/all_newsletters.html', {'newsletters': newsletters})
 
 @login_required
@@ -71,7 +99,7 @@ def create_article(request):
     """
     if request.user.role == 'editor':
         messages.error(request, "Editors cannot create articles.")
-        return redirect('home')
+        return HttpResponseRedirect(fast_reverse('home'))
 
     if request.method == 'POST':
         form = ArticleForm(request.POST)
@@ -80,7 +108,7 @@ def create_article(request):
             article.author = request.user
             article.save()
             messages.success(request, 'Article created successfully! Waiting for editor approval.')
-            return redirect('home')
+            return HttpResponseRedirect(fast_reverse('home'))
     else:
         form = ArticleForm()
     return render(request, 'news_app/create_article.html', {'form': form})
@@ -100,8 +128,11 @@ def approve_articles(request):
     Returns:
         HttpResponse: Approval interface with pending articles
     """
-    pending_articles = Article.objects.filter(is_approved=False)
-    return render(request, 'news_app/approve_articles.html', {'articles': pending_articles})
+    pending_articles, more_pending = _approval_queue(Article.objects.filter(is_approved=False))
+    return render(request, 'news_app/approve_articles.html', {
+        'articles': pending_articles,
+        'more_pending': more_pending,
+    })
 
 @login_required
 @user_passes_test(lambda u: u.role == 'editor')
@@ -109,9 +140,9 @@ def approve_article(request, article_id):
     """
     Process article approval with notification workflows.
     
-    Handles editorial approval of articles, sends email notifications
-    to subscribers, and integrates with Twitter for publication
-    announcements. Includes comprehensive debug logging.
+    Handles editorial approval of articles and queues the email
+    notifications to subscribers and the Twitter announcement as a
+    background task.
     
     Args:
         request: HTTP request object
@@ -120,58 +151,32 @@ def approve_article(request, article_id):
     Returns:
         HttpResponseRedirect: Redirect to approval queue with status
     """
-    article = get_object_or_404(Article, id=article_id)
-    
-    print(f"DEBUG: Approve article view called for article ID: {article_id}")
-    print(f"DEBUG: Article title: {article.title}")
-    print(f"DEBUG: Article currently approved: {article.is_approved}")
-    
-    if not article.is_approved:
-        article.is_approved = True
-        article.save()
-        
-        print("DEBUG: Article saved as approved")
-        
-        subscribers = CustomUser.objects.filter(role='reader')
-        subject = f'New Article Published: {article.title}'
-        
-        print(f"DEBUG: Found {subscribers.count()} subscribers")
-        
-        email_count = 0
-        for subscriber in subscribers:
-            print(f"DEBUG: Preparing email for {subscriber.email}")
-            
-            message = render_to_string('news_app/email/new_article.html', {
-                'subscriber': subscriber,
-                'article': article,
-                'site_url': 'http://localhost:8000'
-            })
-            
-            try:
-                send_mail(
-                    subject,
-                    message,
-                    settings.DEFAULT_FROM_EMAIL,
-                    [subscriber.email],
-                    html_message=message,
-                    fail_silently=False,
-                )
-                email_count += 1
-                print(f"DEBUG: Sent email to {subscriber.email}")
-            except Exception as e:
-                print(f"DEBUG: Failed to send email to {subscriber.email}: {e}")
-        
-        print("DEBUG: Calling Twitter integration")
-        twitter_result = post_to_twitter(article)
-        print(f"DEBUG: Twitter result: {twitter_result}")
-        
-        messages.success(request, f'Article "{article.title}" approved successfully! Notifications sent to {email_count} subscribers.')
-        print(f"DEBUG: Success message set for {email_count} subscribers")
+    # Approval only reads the title; skip loading the content
+    article = get_object_or_404(Article.objects.only('id', 'title', 'is_approved'), id=article_id)
+    
+    logger.debug("Approve article %s (%s), currently approved: %s",
+                 article_id, article.title, article.is_approved)
+    
+    # Conditional UPDATE of the one column: it skips the save signals and
+    # its row count says whether this request did the approving, so two
+    # editors approving at once cannot both queue notifications. The
+    # follow-up work only runs once the approval has committed.
+    with transaction.atomic():
+        approved = Article.objects.filter(id=article_id, is_approved=False).update(is_approved=True)
+        if approved:
+            # update() bypasses the post_save receiver that expires API caches
+            bump_version_on_commit(ARTICLES_VERSION_KEY)
+            # Email readers and post to Twitter in the background
+            enqueue(notify_readers_of_article, article.id)
+    
+    if approved:
+        logger.debug("Article %s approved, reader notifications queued", article_id)
+        messages.success(request, f'Article "{article.title}" approved successfully! Notifications are being sent to subscribers.')
     else:
         messages.info(request, f'Article "{article.title}" was already approved.')
-        print("DEBUG: Article was already approved, no notifications sent")
+        logger.debug("Article %s was already approved, no notifications sent", article_id)
     
-    return redirect('approve_articles')
+    return HttpResponseRedirect(fast_reverse('articles:approve_list'))
 
 @login_required
 def my_articles(request):
@@ -187,7 +192,7 @@ def my_articles(request):
     Returns:
         HttpResponse: Personal article management dashboard
     """
-    articles = Article.objects.filter(author=request.user).order_by('-created_at')
+    articles = Article.objects.filter(author=request.user).select_related('author', 'publisher').order_by('-created_at')
     return render(request, 'news_app/my_articles.html', {'articles': articles})
 
 @login_required
@@ -207,7 +212,7 @@ def update_article(request, article_id):
     """
     article = get_object_or_404(Article, id=article_id)
 
-    if request.user != article.author and request.user.role != 'editor':
+    if request.user.pk != article.author_id and request.user.role != 'editor':
         return HttpResponseForbidden("You don't have permission to edit this article.")
 
     if request.method == 'POST':
@@ -215,7 +220,7 @@ def update_article(request, article_id):
         if form.is_valid():
             form.save()
             messages.success(request, 'Article updated successfully!')
-            return redirect('dashboard')
+            return HttpResponseRedirect(fast_reverse('dashboard'))
     else:
         form = ArticleForm(instance=article)
 
@@ -236,15 +241,23 @@ def delete_article(request, article_id):
     Returns:
         HttpResponse: Confirmation page or redirect after deletion
     """
-    article = get_object_or_404(Article, id=article_id)
+    if request.method == 'POST':
+        # Deleting only needs the author for the permission check
+        articles = Article.objects.only('id', 'author_id')
+    else:
+        # The confirmation page shows the title, author, date and a preview
+        articles = Article.objects.select_related('author').only(
+            'id', 'title', 'content', 'created_at', 'author', 'author__username'
+        )
+    article = get_object_or_404(articles, id=article_id)
 
-    if request.user != article.author and request.user.role != 'editor':
+    if request.user.pk != article.author_id and request.user.role != 'editor':
         return HttpResponseForbidden("You don't have permission to delete this article.")
 
     if request.method == 'POST':
         article.delete()
         messages.success(request, 'Article deleted successfully!')
-        return redirect('dashboard')
+        return HttpResponseRedirect(fast_reverse('dashboard'))
 
     return render(request, 'news_app/delete_article.html', {'article': article})
 
@@ -264,11 +277,11 @@ def dashboard(request):
     """
     user = request.user
     if user.role == 'journalist':
-        articles = Article.objects.filter(author=user).order_by('-created_at')
+        articles = Article.objects.filter(author=user).select_related('author', 'publisher').order_by('-created_at')
     elif user.role == 'editor':
-        articles = Article.objects.all().order_by('-created_at')
+        articles = Article.objects.select_related('author', 'publisher').order_by('-created_at')
     else:
-        return redirect('home')
+        return HttpResponseRedirect(fast_reverse('home'))
 
     return render(request, 'news_app/dashboard.html', {'articles': articles})
 
@@ -288,13 +301,13 @@ def edit_article(request, article_id):
         HttpResponse: Edit form or redirect to dashboard
     """
     article = get_object_or_404(Article, id=article_id)
-    if request.user != article.author and request.user.role != 'editor':
-        return redirect('dashboard')
+    if request.user.pk != article.author_id and request.user.role != 'editor':
+        return HttpResponseRedirect(fast_reverse('dashboard'))
     if request.method == 'POST':
         form = ArticleForm(request.POST, instance=article)
         if form.is_valid():
             form.save()
-            return redirect('dashboard')
+            return HttpResponseRedirect(fast_reverse('dashboard'))
     else:
         form = ArticleForm(instance=article)
     return render(request, 'news_app/edit_article.html', {'form': form, 'article': article})
@@ -315,12 +328,13 @@ def subscribe_journalist(request, journalist_id):
         HttpResponseRedirect: Redirect to homepage with status message
     """
     if request.user.role != 'reader':
-        return redirect('home')
+        messages.error(request, SUBSCRIBE_READERS_ONLY)
+        return HttpResponseRedirect(fast_reverse('home'))
     
     journalist = get_object_or_404(CustomUser, id=journalist_id, role='journalist')
     request.user.subscribed_journalists.add(journalist)
     messages.success(request, f"Subscribed to {journalist.username}!")
-    return redirect('home')
+    return HttpResponseRedirect(fast_reverse('home'))
 
 @login_required
 def subscribe_publisher(request, publisher_id):
@@ -338,12 +352,46 @@ def subscribe_publisher(request, publisher_id):
         HttpResponseRedirect: Redirect to homepage with status message
     """
     if request.user.role != 'reader':
-        return redirect('home')
+        messages.error(request, SUBSCRIBE_READERS_ONLY)
+        return HttpResponseRedirect(fast_reverse('home'))
     
     publisher = get_object_or_404(Publisher, id=publisher_id)
     request.user.subscribed_publishers.add(publisher)
     messages.success(request, f"Subscribed to {publisher.name}!")
-    return redirect('home')
+    return HttpResponseRedirect(fast_reverse('home'))
+
+@login_required
+@require_POST
+def subscribe_many(request):
+    """
+    Handle subscribing a reader to several journalists and publishers at once.
+    
+    Reads ``journalist_ids`` and ``publisher_ids`` from the POST data and
+    adds each set of subscriptions with a single bulk insert rather than
+    one insert per subscription.
+    
+    Args:
+        request: HTTP request object with form data
+        
+    Returns:
+        HttpResponseRedirect: Redirect to homepage with status message
+    """
+    if request.user.role != 'reader':
+        messages.error(request, SUBSCRIBE_READERS_ONLY)
+        return HttpResponseRedirect(fast_reverse('home'))
+    
+    # Anything but plain ASCII digits would make the id__in lookups raise;
+    # str.isdigit() alone also accepts characters such as '²'
+    journalist_ids = [value for value in request.POST.getlist('journalist_ids') if value.isascii() and value.isdigit()]
+    publisher_ids = [value for value in request.POST.getlist('publisher_ids') if value.isascii() and value.isdigit()]
+    journalists = CustomUser.objects.filter(id__in=journalist_ids, role='journalist').only('id')
+    publishers = Publisher.objects.filter(id__in=publisher_ids).only('id')
+    
+    # add(*objs) inserts every missing row in one statement
+    request.user.subscribed_journalists.add(*journalists)
+    request.user.subscribed_publishers.add(*publishers)
+    messages.success(request, "Subscriptions updated!")
+    return HttpResponseRedirect(fast_reverse('home'))
 
 @login_required
 def create_newsletter(request):
@@ -361,7 +409,7 @@ def create_newsletter(request):
     """
     if request.user.role != 'journalist':
         messages.error(request, 'Only journalists can create newsletters.')
-        return redirect('home')
+        return HttpResponseRedirect(fast_reverse('home'))
     
     if request.method == 'POST':
         form = NewsletterForm(request.POST)
@@ -370,7 +418,7 @@ def create_newsletter(request):
             newsletter.author = request.user
             newsletter.save()
             messages.success(request, 'Newsletter created successfully! Waiting for editor approval.')
-            return redirect('home')
+            return HttpResponseRedirect(fast_reverse('home'))
     else:
         form = NewsletterForm()
     
@@ -390,7 +438,7 @@ def my_newsletters(request):
     Returns:
         HttpResponse: Personal newsletter management dashboard
     """
-    newsletters = Newsletter.objects.filter(author=request.user).order_by('-created_at')
+    newsletters = Newsletter.objects.filter(author=request.user).select_related('author', 'publisher').order_by('-created_at')
     return render(request, 'news_app/my_newsletters.html', {'newsletters': newsletters})
 
 @login_required
@@ -408,8 +456,11 @@ def approve_newsletters(request):
     Returns:
         HttpResponse: Newsletter approval interface
     """
-    pending_newsletters = Newsletter.objects.filter(is_approved=False)
-    return render(request, 'news_app/approve_newsletters.html', {'newsletters': pending_newsletters})
+    pending_newsletters, more_pending = _approval_queue(Newsletter.objects.filter(is_approved=False))
+    return render(request, 'news_app/approve_newsletters.html', {
+        'newsletters': pending_newsletters,
+        'more_pending': more_pending,
+    })
 
 @login_required
 @user_passes_test(lambda u: u.role == 'editor')
@@ -417,9 +468,9 @@ def approve_newsletter(request, newsletter_id):
     """
     Process newsletter approval with subscriber notifications.
     
-    Handles editorial approval of newsletters, sends email
-    notifications to readers, and integrates with social media
-    for publication announcements.
+    Handles editorial approval of newsletters and queues the email
+    notifications to readers and the social media announcement
+    as a background task.
     
     Args:
         request: HTTP request object
@@ -428,49 +479,20 @@ def approve_newsletter(request, newsletter_id):
     Returns:
         HttpResponseRedirect: Redirect to approval queue with status
     """
-    newsletter = get_object_or_404(Newsletter, id=newsletter_id)
+    newsletter = get_object_or_404(Newsletter.objects.only('id', 'title'), id=newsletter_id)
     
-    if not newsletter.is_approved:
-        newsletter.is_approved = True
-        newsletter.save()
-        
-        # Send email notifications to subscribers
-        subscribers = CustomUser.objects.filter(role='reader')
-        subject = f'New Newsletter: {newsletter.title}'
-        
-        email_count = 0
-        for subscriber in subscribers:
-            try:
-                message = render_to_string('news_app/email/new_newsletter.html', {
-                    'subscriber': subscriber,
-                    'newsletter': newsletter,
-                    'site_url': 'http://localhost:8000'
-                })
-                
-                send_mail(
-                    subject,
-                    message,
-                    settings.DEFAULT_FROM_EMAIL,
-                    [subscriber.email],
-                    html_message=message,
-                    fail_silently=True,
-                )
-                email_count += 1
-            except Exception as e:
-                print(f'Newsletter email failed for {subscriber.email}: {e}')
-        
-        # Post to Twitter
-        try:
-            twitter_result = post_to_twitter(newsletter)
-            print(f'Newsletter Twitter post: {twitter_result}')
-        except Exception as e:
-            print(f'Newsletter Twitter failed: {e}')
-        
-        messages.success(request, f'Newsletter \"{newsletter.title}\" approved! Notifications sent to {email_count} subscribers.')
+    with transaction.atomic():
+        approved = Newsletter.objects.filter(id=newsletter_id, is_approved=False).update(is_approved=True)
+        if approved:
+            # Email readers and post to Twitter in the background
+            enqueue(notify_readers_of_newsletter, newsletter.id)
+    
+    if approved:
+        messages.success(request, f'Newsletter \"{newsletter.title}\" approved! Notifications are being sent to subscribers.')
     else:
         messages.info(request, f'Newsletter \"{newsletter.title}\" was already approved.')
     
-    return redirect('approve_newsletters')
+    return HttpResponseRedirect(fast_reverse('newsletters:approve_list'))
 
 @login_required
 def edit_newsletter(request, newsletter_id):
@@ -488,15 +510,15 @@ def edit_newsletter(request, newsletter_id):
         HttpResponse: Edit form or redirect to newsletter list
     """
     newsletter = get_object_or_404(Newsletter, id=newsletter_id)
-    if request.user != newsletter.author and request.user.role != 'editor':
-        return redirect('my_newsletters')
+    if request.user.pk != newsletter.author_id and request.user.role != 'editor':
+        return HttpResponseRedirect(fast_reverse('my_newsletters'))
     
     if request.method == 'POST':
         form = NewsletterForm(request.POST, instance=newsletter)
         if form.is_valid():
             form.save()
             messages.success(request, 'Newsletter updated successfully!')
-            return redirect('my_newsletters')
+            return HttpResponseRedirect(fast_reverse('my_newsletters'))
     else:
         form = NewsletterForm(instance=newsletter)
     
@@ -518,13 +540,13 @@ def delete_newsletter(request, newsletter_id):
         HttpResponse: Confirmation page or redirect after deletion
     """
     newsletter = get_object_or_404(Newsletter, id=newsletter_id)
-    if request.user != newsletter.author and request.user.role != 'editor':
-        return redirect('my_newsletters')
+    if request.user.pk != newsletter.author_id and request.user.role != 'editor':
+        return HttpResponseRedirect(fast_reverse('my_newsletters'))
     
     if request.method == 'POST':
         newsletter.delete()
         messages.success(request, 'Newsletter deleted successfully!')
-        return redirect('my_newsletters')
+        return HttpResponseRedirect(fast_reverse('my_newsletters'))
     
     return render(request, 'news_app/delete_newsletter.html', {'newsletter': newsletter})
 
@@ -542,5 +564,7 @@ def article_detail(request, article_id):
     Returns:
         HttpResponse: Article detail page with full content
     """
-    article = get_object_or_404(Article, id=article_id, is_approved=True)
+    article = get_object_or_404(
+        Article.objects.select_related('author', 'publisher'), id=article_id, is_approved=True
+    )
     return render(request, 'news_app/article_detail.html', {'article': article})
\ No newline at end of file
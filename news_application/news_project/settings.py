@@ -70,6 +70,15 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
+        'OPTIONS': {
+            # WAL lets readers run alongside the writer and NORMAL sync
+            # skips the fsync on every commit (safe with WAL)
+            'init_command': (
+                'PRAGMA journal_mode=WAL;'
+                'PRAGMA synchronous=NORMAL;'
+                'PRAGMA temp_store=MEMORY;'
+            ),
+        },
     }
 }
 
@@ -81,9 +90,34 @@ DATABASES = {
         'PASSWORD': 'ihatemaria',
         'HOST': 'localhost',
         'PORT': '3306',
+        # Reuse connections across requests instead of reconnecting each time
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {
+            'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
+            'charset': 'utf8mb4',
+        },
     }
 }'''
 
+# Cache Configuration
+# API list responses are only cached with a backend shared by every
+# worker process. Set REDIS_URL (and install redis) to enable it; the
+# per-process LocMemCache fallback leaves list caching off
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
 USE_I18N = True
@@ -99,6 +133,33 @@ EMAIL_PORT = 25
 EMAIL_USE_TLS = False
 DEFAULT_FROM_EMAIL = 'newsapp@example.com'
 
+# Notification tasks (news_app.tasks) run on a background thread pool after
+# the approving transaction commits; set True to run them inline instead
+NOTIFICATION_TASKS_EAGER = False
+
+# X (Twitter) API token for approval announcements; posts are only
+# simulated when it is not set
+TWITTER_BEARER_TOKEN = os.environ.get('TWITTER_BEARER_TOKEN')
+
+# Logging Configuration
+# news_app debug output (approval and notification details) is only
+# shown while DEBUG is on; production logs start at INFO
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'news_app': {
+            'handlers': ['console'],
+            'level': 'DEBUG' if DEBUG else 'INFO',
+        },
+    },
+}
+
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
@@ -0,0 +1,28 @@
+"""
+Django settings for running the test suite.
+
+Run with: python manage.py test --settings=news_project.settings_test --parallel
+"""
+
+from .settings import *  # noqa: F401,F403
+
+# Password hashing is deliberately slow in production; tests only need
+# a hasher that round-trips, so use the fast (insecure) MD5 hasher
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Always test against an in-memory SQLite database, whatever backend the
+# main settings use, so tests never wait on disk syncs or a MariaDB
+# connection. The WAL pragmas from the main settings do not apply to an
+# in-memory database and are dropped
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# Run notification tasks inline instead of on the worker thread pool, so
+# no background thread touches the test database
+NOTIFICATION_TASKS_EAGER = True
@@ -3,25 +3,34 @@
 MariaDB Setup Helper for News Application
 """
 
-import subprocess
-import sys
-import os
+import shutil
 
-def run_command(command):
-    """Execute a shell command"""
-    try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
-        return result.returncode == 0, result.stdout, result.stderr
-    except Exception as e:
-        return False, "", str(e)
+# Persistent connections (CONN_MAX_AGE) avoid a TCP connect and MariaDB
+# authentication handshake on every request
+DATABASES_BLOCK = """
+   DATABASES = {
+       'default': {
+           'ENGINE': 'django.db.backends.mysql',
+           'NAME': 'news_app_db',
+           'USER': 'news_user',
+           'PASSWORD': 'news_password',
+           'HOST': 'localhost',
+           'PORT': '3306',
+           'CONN_MAX_AGE': 600,
+           'CONN_HEALTH_CHECKS': True,
+           'OPTIONS': {
+               'init_command': "SET sql_mode='STRICT_TRANS_TABLES'",
+               'charset': 'utf8mb4',
+           },
+       }
+   }"""
 
 def main():
     print("🚀 MariaDB Setup for News Application")
     print("=" * 50)
     
     # Check if MySQL client is available
-    success, stdout, stderr = run_command("which mysql")
-    if not success:
+    if shutil.which("mysql") is None:
         print(" MySQL client not found.")
         print("   Please install MariaDB first:")
         print("   On macOS: brew install mariadb")
@@ -48,6 +57,17 @@ def main():
     print("   Edit news_project/settings.py:")
     print("   - Uncomment the MariaDB DATABASES configuration")
     print("   - Update NAME, USER, PASSWORD with your values")
+    print("   - Keep persistent connections so requests reuse them:")
+    print(DATABASES_BLOCK)
+    
+    print("\nOptional: Connection pooling")
+    print("   For high concurrency, share a pool of connections across threads:")
+    print("   pip install django-db-connection-pool[mysql]")
+    print("   Then in the DATABASES block above:")
+    print("   - Set 'ENGINE': 'dj_db_conn_pool.backends.mysql'")
+    print("   - Add 'POOL_OPTIONS': {'POOL_SIZE': 25, 'MAX_OVERFLOW': 25}")
+    print("   - Make sure MariaDB allows enough connections for every worker:")
+    print("     SET GLOBAL max_connections = 200;  -- >= workers x (POOL_SIZE + MAX_OVERFLOW)")
     
     print("\n4. Run migrations:")
     print("   python manage.py makemigrations")
@@ -22,3 +22,5 @@ class UserUpdateForm(UserChangeForm):
     class Meta:
         model = CustomUser
         fields = ('username', 'email', 'first_name', 'last_name', 'bio')
+        # bio is a VARCHAR column but still edited as free text
+        widgets = {'bio': forms.Textarea}
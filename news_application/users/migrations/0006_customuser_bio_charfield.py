@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_customuser_role_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='customuser',
+            name='bio',
+            field=models.CharField(blank=True, default='', max_length=500),
+        ),
+    ]
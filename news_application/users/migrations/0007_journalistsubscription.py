@@ -0,0 +1,65 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:41
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0006_customuser_bio_charfield'),
+    ]
+
+    operations = [
+        # Adopt the table Django created for the relation as it stands,
+        # then rename its columns so existing subscriptions are kept
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='JournalistSubscription',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('from_customuser', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                        ('to_customuser', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                    ],
+                    options={
+                        'db_table': 'auth_user_subscribed_journalists',
+                        'unique_together': {('from_customuser', 'to_customuser')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='customuser',
+                    name='subscribed_journalists',
+                    field=models.ManyToManyField(blank=True, limit_choices_to={'role': 'journalist'}, related_name='subscribers', through='users.JournalistSubscription', through_fields=('from_customuser', 'to_customuser'), to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+            database_operations=[],
+        ),
+        migrations.RenameField(
+            model_name='journalistsubscription',
+            old_name='from_customuser',
+            new_name='reader',
+        ),
+        migrations.RenameField(
+            model_name='journalistsubscription',
+            old_name='to_customuser',
+            new_name='journalist',
+        ),
+        migrations.AlterField(
+            model_name='customuser',
+            name='subscribed_journalists',
+            field=models.ManyToManyField(blank=True, limit_choices_to={'role': 'journalist'}, related_name='subscribers', through='users.JournalistSubscription', through_fields=('reader', 'journalist'), to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='journalistsubscription',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='journalistsubscription',
+            index=models.Index(fields=['journalist', 'reader'], name='auth_user_s_journal_38dca7_idx'),
+        ),
+    ]
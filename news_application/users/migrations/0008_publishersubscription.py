@@ -0,0 +1,56 @@
+# Generated by Django 5.2.7 on 2026-10-15 23:05
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news_app', '0001_initial'),
+        ('users', '0007_journalistsubscription'),
+    ]
+
+    operations = [
+        # Adopt the table Django created for the relation as it stands,
+        # then rename its user column so existing subscriptions are kept
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='PublisherSubscription',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('customuser', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                        ('publisher', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='news_app.publisher')),
+                    ],
+                    options={
+                        'db_table': 'auth_user_subscribed_publishers',
+                        'unique_together': {('customuser', 'publisher')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='customuser',
+                    name='subscribed_publishers',
+                    field=models.ManyToManyField(blank=True, related_name='subscribers', through='users.PublisherSubscription', to='news_app.publisher'),
+                ),
+            ],
+            database_operations=[],
+        ),
+        migrations.RenameField(
+            model_name='publishersubscription',
+            old_name='customuser',
+            new_name='reader',
+        ),
+        migrations.AddField(
+            model_name='publishersubscription',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='publishersubscription',
+            index=models.Index(fields=['publisher', 'reader'], name='auth_user_s_publish_7b5089_idx'),
+        ),
+    ]
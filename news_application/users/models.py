@@ -19,8 +19,8 @@ class CustomUser(AbstractUser):
         ('editor', 'Editor'),
     ]
     
-    role = models.CharField(max_length=20, choices=ROLE_CHOICES, default='reader')
-    bio = models.TextField(max_length=500, blank=True)
+    role = models.CharField(max_length=20, choices=ROLE_CHOICES, default='reader', db_index=True)
+    bio = models.CharField(max_length=500, blank=True, default='')
     
     # Subscription fields for readers
     subscribed_journalists = models.ManyToManyField(
@@ -28,12 +28,15 @@ class CustomUser(AbstractUser):
         symmetrical=False, 
         blank=True, 
         related_name='subscribers',
-        limit_choices_to={'role': 'journalist'}
+        limit_choices_to={'role': 'journalist'},
+        through='JournalistSubscription',
+        through_fields=('reader', 'journalist'),
     )
     subscribed_publishers = models.ManyToManyField(
         'news_app.Publisher',
         blank=True,
-        related_name='subscribers'
+        related_name='subscribers',
+        through='PublisherSubscription',
     )
 
     def __str__(self):
@@ -41,3 +44,57 @@ class CustomUser(AbstractUser):
 
     class Meta:
         db_table = 'auth_user'
+
+
+class JournalistSubscription(models.Model):
+    """
+    A reader's subscription to a journalist.
+    
+    Through model for ``CustomUser.subscribed_journalists``, kept on the
+    table Django originally created for the relation.
+    
+    Attributes:
+        reader (ForeignKey): The subscribing reader
+        journalist (ForeignKey): The journalist subscribed to
+        created_at (DateTimeField): When the subscription was made
+    """
+    reader = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='+')
+    journalist = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='+')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'auth_user_subscribed_journalists'
+        unique_together = [('reader', 'journalist')]
+        # Notification fan-out looks up the readers of one journalist;
+        # (journalist, reader) answers that from the index alone
+        indexes = [models.Index(fields=['journalist', 'reader'])]
+
+    def __str__(self):
+        return f"{self.reader.username} -> {self.journalist.username}"
+
+
+class PublisherSubscription(models.Model):
+    """
+    A reader's subscription to a publisher.
+    
+    Through model for ``CustomUser.subscribed_publishers``, kept on the
+    table Django originally created for the relation.
+    
+    Attributes:
+        reader (ForeignKey): The subscribing reader
+        publisher (ForeignKey): The publisher subscribed to
+        created_at (DateTimeField): When the subscription was made
+    """
+    reader = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='+')
+    publisher = models.ForeignKey('news_app.Publisher', on_delete=models.CASCADE, related_name='+')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'auth_user_subscribed_publishers'
+        unique_together = [('reader', 'publisher')]
+        # publisher.subscribers is read on every newsletter publish;
+        # leading with publisher makes that a range scan on this index
+        indexes = [models.Index(fields=['publisher', 'reader'])]
+
+    def __str__(self):
+        return f"{self.reader.username} -> {self.publisher.name}"
@@ -1,19 +1,28 @@
+from io import StringIO
 from django.test import TestCase
+from django.core.management import call_command
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.contrib.messages import get_messages
 from django.urls import reverse
+from news_app.models import Publisher
+from .models import JournalistSubscription, PublisherSubscription
 
 class UserModelTests(TestCase):
-    def setUp(self):
-        self.user_model = get_user_model()
-
-    def test_create_user(self):
-        """Test creating a new user"""
-        user = self.user_model.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        # One reader shared by the tests; created once per class
+        cls.user_model = get_user_model()
+        cls.reader = cls.user_model.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123',
             role='reader'
         )
+
+    def test_create_user(self):
+        """Test creating a new user"""
+        user = self.reader
         
         self.assertEqual(user.username, 'testuser')
         self.assertEqual(user.email, 'test@example.com')
@@ -38,11 +47,7 @@ class UserModelTests(TestCase):
 
     def test_user_role_choices(self):
         """Test that user role choices are correct"""
-        user = self.user_model.objects.create_user(
-            username='testuser',
-            password='testpass123',
-            role='reader'
-        )
+        user = self.reader
         
         # Test valid role
         user.role = 'editor'
@@ -54,24 +59,55 @@ class UserModelTests(TestCase):
 
     def test_user_authentication(self):
         """Test user authentication"""
-        user = self.user_model.objects.create_user(
-            username='authuser',
-            password='authpass123'
-        )
+        # The shared reader already holds the stored hash, so no re-fetch is needed
+        self.assertTrue(self.reader.check_password('testpass123'))
+
+    def test_journalist_subscription_records_created_at(self):
+        """Test that subscribing creates a timestamped through row"""
+        journalist = self.user_model.objects.create_user(username='journo', password='x', role='journalist')
+        self.reader.subscribed_journalists.add(journalist)
         
-        # Test authentication
-        authenticated = self.user_model.objects.get(username='authuser').check_password('authpass123')
-        self.assertTrue(authenticated)
+        subscription = JournalistSubscription.objects.get(reader=self.reader)
+        self.assertEqual(subscription.journalist, journalist)
+        self.assertIsNotNone(subscription.created_at)
+        self.assertQuerySetEqual(journalist.subscribers.all(), [self.reader])
+
+    def test_publisher_subscription_records_created_at(self):
+        """Test that subscribing to a publisher creates a timestamped through row"""
+        publisher = Publisher.objects.create(name='Daily Planet')
+        self.reader.subscribed_publishers.add(publisher)
+        
+        subscription = PublisherSubscription.objects.get(reader=self.reader)
+        self.assertEqual(subscription.publisher, publisher)
+        self.assertIsNotNone(subscription.created_at)
+        self.assertQuerySetEqual(publisher.subscribers.all(), [self.reader])
+
+class SetupGroupsTests(TestCase):
+    def test_setup_groups_assigns_permissions(self):
+        """Test that setup_groups creates each group with its permissions and is repeatable"""
+        call_command('setup_groups', stdout=StringIO())
+        call_command('setup_groups', stdout=StringIO())
+        
+        def codenames(name):
+            return set(Group.objects.get(name=name).permissions.values_list('codename', flat=True))
+        
+        self.assertEqual(codenames('Reader'), {'view_article'})
+        self.assertEqual(codenames('Editor'), {'view_article', 'change_article', 'delete_article'})
+        self.assertEqual(
+            codenames('Journalist'),
+            {'add_article', 'view_article', 'change_article', 'delete_article'}
+        )
 
 class AuthenticationTests(TestCase):
-    def test_login_view(self):
-        """Test login view"""
-        self.user_model = get_user_model()
-        user = self.user_model.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             username='loginuser',
             password='loginpass123'
         )
-        
+
+    def test_login_view(self):
+        """Test login view"""
         response = self.client.get(reverse('login'))
         self.assertEqual(response.status_code, 200)
         
@@ -81,14 +117,8 @@ class AuthenticationTests(TestCase):
 
     def test_logout_view(self):
         """Test logout view - use POST method"""
-        self.user_model = get_user_model()
-        user = self.user_model.objects.create_user(
-            username='logoutuser',
-            password='logoutpass123'
-        )
-        
         # Login first
-        self.client.login(username='logoutuser', password='logoutpass123')
+        self.client.login(username='loginuser', password='loginpass123')
         
         # Test logout with POST (required for security)
         response = self.client.post(reverse('logout'))
@@ -97,3 +127,23 @@ class AuthenticationTests(TestCase):
         # Also test that GET method is not allowed
         response_get = self.client.get(reverse('logout'))
         self.assertEqual(response_get.status_code, 405)  # Method Not Allowed
+
+    def test_register_redirects_to_login(self):
+        """Test that successful registration redirects to the login page"""
+        response = self.client.post(reverse('register'), {
+            'username': 'newuser',
+            'email': 'new@example.com',
+            'role': 'reader',
+            'password1': 'Str0ng-passw0rd!',
+            'password2': 'Str0ng-passw0rd!',
+        })
+        self.assertRedirects(response, reverse('login'))
+        self.assertTrue(get_user_model().objects.filter(username='newuser').exists())
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            ['Account created for newuser! You can now log in.']
+        )
+
+    def test_register_rejects_other_methods(self):
+        """Test that registration only accepts GET and POST"""
+        self.assertEqual(self.client.put(reverse('register')).status_code, 405)
@@ -1,8 +1,14 @@
-from django.shortcuts import render, redirect
+from django.shortcuts import render
 from django.contrib.auth import login
-from django.contrib import messages
+from django.contrib.messages import SUCCESS, add_message
+from django.http import HttpResponseRedirect
+from django.views.decorators.csrf import csrf_protect
+from django.views.decorators.http import require_http_methods
+from news_app.shortcuts import fast_reverse
 from .forms import CustomUserCreationForm
 
+@require_http_methods(['GET', 'POST'])
+@csrf_protect
 def register(request):
     """
     Handle new user registration with custom user creation.
@@ -22,8 +28,8 @@ def register(request):
         if form.is_valid():
             user = form.save()
             username = form.cleaned_data.get('username')
-            messages.success(request, f'Account created for {username}! You can now log in.')
-            return redirect('login')
+            add_message(request, SUCCESS, 'Account created for %s! You can now log in.' % username)
+            return HttpResponseRedirect(fast_reverse('login'))
     else:
         form = CustomUserCreationForm()
     return render(request, 'register.html', {'form': form})
\ No newline at end of file